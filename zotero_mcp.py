@@ -35,16 +35,31 @@ Configure in Claude Desktop / claude_desktop_config.json:
 """
 
 import asyncio
+import hashlib
 import json
 import os
 import re
 import sqlite3
 import sys
+import threading
+import time
+from collections import Counter, OrderedDict, defaultdict
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional, Dict, List
+from typing import Any, Optional, Dict, FrozenSet, List, Tuple
 
 import httpx
 
+try:
+    from rapidfuzz import fuzz
+except ImportError:  # Fall back to the pure-Python trigram matcher
+    fuzz = None
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib json codec
+    orjson = None
+
 from mcp.server import Server
 from mcp.types import (
     Tool,
@@ -61,26 +76,130 @@ PLUGIN_RPC_URL = f"{PLUGIN_BASE_URL}/zotero-mcp/rpc"
 PLUGIN_HEALTH_URL = f"{PLUGIN_BASE_URL}/zotero-mcp/health"
 
 
+# Shared client so plugin calls reuse a keep-alive connection instead of
+# opening a new socket per request (created lazily inside the event loop)
+_client: Optional[httpx.AsyncClient] = None
+
+
+async def _get_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client for plugin calls."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=4),
+        )
+    return _client
+
+
+async def _close_client() -> None:
+    """Close the shared HTTP client, if one was created."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+# Seconds a plugin health check result is reused before probing again
+PLUGIN_HEALTH_TTL = 5.0
+
+# Last health check result (None = unknown) and its time.monotonic() stamp.
+# The lock makes concurrent callers share one probe; like _client it is
+# created lazily inside the event loop.
+_plugin_status: Optional[bool] = None
+_plugin_checked_at = 0.0
+_plugin_lock: Optional[asyncio.Lock] = None
+
+
 async def _plugin_available() -> bool:
-    """Check if the Zotero MCP Bridge plugin is running."""
-    try:
-        async with httpx.AsyncClient() as client:
-            r = await client.get(PLUGIN_HEALTH_URL, timeout=2.0)
-            return r.status_code == 200
-    except Exception:
-        return False
+    """Check if the Zotero MCP Bridge plugin is running.
+
+    The answer is cached for PLUGIN_HEALTH_TTL seconds, so tool listings
+    and stats calls don't each pay for an HTTP probe.
+    """
+    global _plugin_status, _plugin_checked_at, _plugin_lock
+    if _plugin_status is not None and time.monotonic() - _plugin_checked_at < PLUGIN_HEALTH_TTL:
+        return _plugin_status
+
+    if _plugin_lock is None:
+        _plugin_lock = asyncio.Lock()
+    async with _plugin_lock:
+        # Another caller may have probed while we waited for the lock
+        if _plugin_status is None or time.monotonic() - _plugin_checked_at >= PLUGIN_HEALTH_TTL:
+            try:
+                client = await _get_client()
+                r = await client.get(PLUGIN_HEALTH_URL, timeout=2.0)
+                _plugin_status = r.status_code == 200
+            except Exception:
+                _plugin_status = False
+            _plugin_checked_at = time.monotonic()
+        return _plugin_status
 
 
 async def _plugin_rpc(method: str, params: dict = None) -> dict:
     """Call the Zotero MCP Bridge plugin's RPC endpoint."""
-    async with httpx.AsyncClient() as client:
+    global _plugin_status
+    client = await _get_client()
+    payload = {"method": method, "params": params or {}}
+    try:
         r = await client.post(
             PLUGIN_RPC_URL,
-            json={"method": method, "params": params or {}},
-            timeout=10.0,
+            content=orjson.dumps(payload) if orjson else json.dumps(payload),
+            headers={"Content-Type": "application/json"},
         )
         r.raise_for_status()
-        return r.json()
+    except httpx.HTTPError:
+        # The plugin may have gone away; re-probe on the next check
+        _plugin_status = None
+        raise
+    # Every plugin method writes to the library
+    if db is not None:
+        db.invalidate_caches()
+    return orjson.loads(r.content) if orjson else r.json()
+
+
+# Item keys sent per collection membership RPC, and how many of those
+# requests may be in flight at once (matches the client's keep-alive pool)
+PLUGIN_RPC_BATCH = 100
+PLUGIN_RPC_CONCURRENCY = 4
+
+
+async def _batched_rpc(
+    method: str, collection_key: str, item_keys: List[str], result_key: str
+) -> dict:
+    """Call a collection membership RPC in chunks of PLUGIN_RPC_BATCH keys.
+
+    Chunks are sent concurrently and their ``result_key`` ("added" or
+    "removed") and "errors" lists are merged. A chunk whose request fails
+    reports each of its keys as an error instead of failing the whole call;
+    if every chunk fails, the first error is raised.
+    """
+    semaphore = asyncio.Semaphore(PLUGIN_RPC_CONCURRENCY)
+
+    async def call(chunk: List[str]) -> dict:
+        async with semaphore:
+            return await _plugin_rpc(method, {
+                "collectionKey": collection_key,
+                "itemKeys": chunk,
+            })
+
+    chunks = [
+        item_keys[start:start + PLUGIN_RPC_BATCH]
+        for start in range(0, len(item_keys), PLUGIN_RPC_BATCH)
+    ] or [[]]
+    results = await asyncio.gather(*(call(c) for c in chunks), return_exceptions=True)
+    if all(isinstance(result, Exception) for result in results):
+        # Plugin down, unknown collection, ...: one error, not one per key
+        raise results[0]
+
+    merged: Dict[str, list] = {result_key: [], "errors": []}
+    for chunk, result in zip(chunks, results):
+        if isinstance(result, Exception):
+            merged["errors"].extend({"key": key, "error": str(result)} for key in chunk)
+            continue
+        merged[result_key].extend(result.get(result_key, []))
+        merged["errors"].extend(result.get("errors", []))
+    return merged
 
 
 # ---------------------------------------------------------------------------
@@ -135,8 +254,68 @@ def find_zotero_db() -> Optional[Path]:
 # Compiled regex for extracting years from date strings
 YEAR_REGEX = re.compile(r"\b(19|20)\d{2}\b")
 
+# Compiled regex for splitting field values into words when scoring
+_WORD_SPLIT = re.compile(r"[^a-zA-Z0-9]+")
+
 DEFAULT_SEARCH_LIMIT = 20
 
+# Minimum rapidfuzz partial_ratio (0-100) for a fuzzy match. partial_ratio is
+# more lenient than the trigram Dice score it replaces, so the cutoff is
+# higher than the trigram threshold of 0.3.
+FUZZY_SCORE_CUTOFF = 70
+
+# Full-text index sidecar. Zotero's own database is opened read-only, so the
+# FTS5 index lives in a separate file that is ATTACHed to the main connection.
+FTS_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "zotero_mcp"
+
+# Column weights for bm25(), in items_fts/items_stem column order
+# (title, abstract, creators, tags, doi, citekey, publication). The first six
+# mirror _score_item; publication is weighted like the abstract, as in the
+# substring search.
+FTS_BM25_WEIGHTS = "3.0, 1.0, 2.0, 1.5, 2.0, 3.0, 1.0"
+
+# Number of items hydrated per batch while (re)building the FTS index
+FTS_BUILD_BATCH = 512
+
+# Extra FTS5 prefix indexes for short tokens: every query term is a prefix
+# query ("tok"*), and 2-3 character prefixes would otherwise expand to a scan
+# over a large range of terms in the main index
+FTS_PREFIX_LENGTHS = "2 3"
+
+# FTS5 tokenizers, both folding diacritics so "muller" matches "Müller".
+# Prefix queries run against the unstemmed items_fts: a stemmed index stores
+# "generative" as "gener", which the partial word "generat" is no prefix of.
+# Whole-word queries also run against items_stem, where porter stemming lets
+# "rendering" match "render".
+FTS_TOKENIZER = "unicode61 remove_diacritics 2"
+FTS_STEM_TOKENIZER = "porter unicode61 remove_diacritics 2"
+
+# Bump when the sidecar schema or contents change so old caches are rebuilt
+FTS_INDEX_VERSION = "6"
+
+# IN-list sizes that batch queries are padded to. Keeping the set of distinct
+# SQL strings small lets sqlite3's statement cache reuse prepared statements
+# instead of re-preparing for every list length. Longer lists are chunked.
+IN_LIST_BUCKETS = (1, 8, 64, 512)
+
+# Padding value for unused IN-list slots (never a valid itemID)
+IN_LIST_PAD = -1
+
+# Size of sqlite3's per-connection prepared statement cache. Covers the
+# bucketed batch statements, the per-token-count search SQL and the fixed
+# queries with room to spare (the module default is 128).
+SQLITE_STATEMENT_CACHE = 256
+
+# Seconds a stat() of the Zotero database file is reused. Every read checks
+# the mtime for external changes, and one tool call can check several times;
+# on network-mounted data directories each stat is a round-trip. Commits
+# within the window are still caught through PRAGMA data_version, which both
+# the in-process caches and the search index sync compare.
+DB_STAT_TTL = 1.0
+
+# Number of items kept by get_item's LRU cache
+ITEM_CACHE_SIZE = 256
+
 
 class ZoteroDb:
     """Read-only access to a local Zotero SQLite database.
@@ -145,26 +324,218 @@ class ZoteroDb:
     Python's sqlite3 module.
     """
 
-    def __init__(self, db_path: Path):
+    # Batch queries keyed by name; {ph} is replaced by a bucketed IN list
+    _BATCH_SQL: Dict[str, str] = {
+        # One round-trip for everything an item dict needs. Rows are
+        # (itemID, kind, a, b, c) with kind-specific columns:
+        #   field:      fieldName, value
+        #   creator:    firstName, lastName, creatorType  (ordered by orderIndex)
+        #   tag:        name
+        #   collection: collectionName
+        #   pdf:        attachment path, attachment key
+        "item_data": """
+            WITH ids(id) AS (VALUES {values})
+            SELECT id.itemID, 'field', f.fieldName, idv.value, NULL, 0
+            FROM itemData id
+            JOIN fields f ON id.fieldID = f.fieldID
+            JOIN itemDataValues idv ON id.valueID = idv.valueID
+            WHERE id.itemID IN ids
+            UNION ALL
+            SELECT ic.itemID, 'creator', c.firstName, c.lastName, ct.creatorType, ic.orderIndex
+            FROM itemCreators ic
+            JOIN creators c ON ic.creatorID = c.creatorID
+            JOIN creatorTypes ct ON ic.creatorTypeID = ct.creatorTypeID
+            WHERE ic.itemID IN ids
+            UNION ALL
+            SELECT it.itemID, 'tag', t.name, NULL, NULL, 0
+            FROM itemTags it
+            JOIN tags t ON it.tagID = t.tagID
+            WHERE it.itemID IN ids
+            UNION ALL
+            SELECT ci.itemID, 'collection', c.collectionName, NULL, NULL, 0
+            FROM collectionItems ci
+            JOIN collections c ON ci.collectionID = c.collectionID
+            WHERE ci.itemID IN ids
+            UNION ALL
+            SELECT ia.parentItemID, 'pdf', ia.path, i.key, NULL, 0
+            FROM itemAttachments ia
+            JOIN items i ON ia.itemID = i.itemID
+            WHERE ia.parentItemID IN ids
+              AND ia.contentType = 'application/pdf'
+              AND ia.itemID NOT IN (SELECT itemID FROM deletedItems)
+        """,
+        # Kept out of item_data: a locked or broken Better BibTeX database
+        # must only cost the citation keys, not the whole lookup
+        "bbt_keys": """
+            SELECT itemID, citationKey FROM bbt.citationkey WHERE itemID IN ({ph})
+        """,
+        "pdf_paths": """
+            SELECT ia.parentItemID, ia.path, i.key
+            FROM itemAttachments ia
+            JOIN items i ON ia.itemID = i.itemID
+            WHERE ia.parentItemID IN ({ph})
+              AND ia.contentType = 'application/pdf'
+              AND ia.itemID NOT IN (SELECT itemID FROM deletedItems)
+        """,
+    }
+
+    def __init__(self, db_path: Path, cache_dir: Optional[Path] = None):
         self.db_path = db_path
         self.data_dir = db_path.parent
+        # One sidecar per database, so servers for different libraries that
+        # share a cache dir never read or rebuild each other's index
+        db_hash = hashlib.sha1(str(db_path.resolve()).encode()).hexdigest()
+        self.fts_path = (cache_dir or FTS_CACHE_DIR) / f"fts-{db_hash}.sqlite"
+        # (mtime, PRAGMA data_version) of the Zotero database the FTS index
+        # was last synced against, and whether the index is usable for it
+        self._fts_version: Optional[Tuple[float, int]] = None
+        self._fts_ready = False
+        # Last stat() of the Zotero database: its mtime (None if missing) and
+        # when it was taken (time.monotonic(), None = never)
+        self._mtime: Optional[float] = None
+        self._mtime_checked_at: Optional[float] = None
+        # (mtime, PRAGMA data_version) of the Zotero database that in-process
+        # caches are valid for
+        self._cache_version: Optional[Tuple[float, int]] = None
+        # Attachment keys that have a directory under storage/
+        self._storage_keys: FrozenSet[str] = frozenset()
+        # get_item results by Zotero key, least recently used first
+        self._item_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._collections_cache: Optional[List[Dict[str, Any]]] = None
+        self._item_count: Optional[int] = None
+        # Whether better-bibtex.sqlite exists; checked when the connection
+        # is opened rather than on every library_stats call
+        self.bbt_present = False
+        self._stmts: Dict[Tuple[str, int], str] = {
+            (name, bucket): sql.format(
+                ph=",".join("?" * bucket),
+                values=",".join(["(?)"] * bucket),
+            )
+            for name, sql in self._BATCH_SQL.items()
+            for bucket in IN_LIST_BUCKETS
+        }
+        # Substring search SQL keyed by (items_flat available, token count)
+        self._like_stmts: Dict[Tuple[bool, int], str] = {}
+        # FTS5 search SQL keyed by number of query terms
+        self._fts_stmts: Dict[int, str] = {}
         self.conn = self._open_connection()
+        self._sync_fts_index()
 
     def _open_connection(self) -> sqlite3.Connection:
         """Open a read-only SQLite connection with performance pragmas."""
         # uri=True enables the ?mode=ro parameter for true read-only
         uri = f"file:{self.db_path}?mode=ro"
-        conn = sqlite3.connect(uri, uri=True)
+        # Tool calls run in worker threads (serialized by the caller), so the
+        # connection must not be tied to the thread that opened it
+        conn = sqlite3.connect(
+            uri,
+            uri=True,
+            check_same_thread=False,
+            cached_statements=SQLITE_STATEMENT_CACHE,
+        )
         conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA query_only = ON")
         conn.execute("PRAGMA temp_store = MEMORY")
+        # Keep hot pages in a 128 MiB page cache across the many small batch
+        # queries (default is 2 MiB); mmap covers the rest of the file, which
+        # for large libraries is commonly a few hundred MiB
+        conn.execute("PRAGMA cache_size = -131072")
         conn.execute("PRAGMA mmap_size = 268435456")
+        # Attach before query_only, which would block creating the stub table
+        self._attach_bbt(conn)
+        conn.execute("PRAGMA query_only = ON")
         return conn
 
+    def _attach_bbt(self, conn: sqlite3.Connection) -> None:
+        """Attach the Better BibTeX database as ``bbt``.
+
+        If BBT is not installed or its schema is unexpected, an empty
+        in-memory ``bbt.citationkey`` table is attached instead so queries
+        can always join against it.
+        """
+        bbt_db_path = self.data_dir / "better-bibtex.sqlite"
+        self.bbt_present = bbt_db_path.exists()
+        if self.bbt_present:
+            try:
+                conn.execute(
+                    "ATTACH DATABASE ? AS bbt", (f"file:{bbt_db_path}?mode=ro",)
+                )
+                conn.execute("SELECT itemID, citationKey FROM bbt.citationkey LIMIT 0")
+                return
+            except sqlite3.Error:
+                attached = {row[1] for row in conn.execute("PRAGMA database_list")}
+                if "bbt" in attached:
+                    conn.execute("DETACH DATABASE bbt")
+
+        conn.execute("ATTACH DATABASE ':memory:' AS bbt")
+        conn.execute(
+            "CREATE TABLE bbt.citationkey (itemID INTEGER PRIMARY KEY, citationKey TEXT)"
+        )
+
     def refresh(self) -> None:
         """Re-open the connection to pick up external changes."""
         self.conn.close()
         self.conn = self._open_connection()
+        self._clear_caches()
+        self._mtime_checked_at = None
+        # The new connection has nothing attached; force a re-sync
+        self._fts_version = None
+        self._fts_ready = False
+        self._sync_fts_index()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.conn.close()
+
+    def invalidate_caches(self) -> None:
+        """Drop cached results on the next lookup (e.g. after a plugin write)."""
+        self._cache_version = None
+        self._mtime_checked_at = None
+
+    def _db_mtime(self) -> Optional[float]:
+        """Return the database file's mtime, re-stat()ing at most every DB_STAT_TTL."""
+        now = time.monotonic()
+        if self._mtime_checked_at is None or now - self._mtime_checked_at >= DB_STAT_TTL:
+            try:
+                self._mtime = self.db_path.stat().st_mtime
+            except OSError:
+                self._mtime = None
+            self._mtime_checked_at = now
+        return self._mtime
+
+    def _check_db_changed(self) -> None:
+        """Drop in-process caches if the Zotero database changed.
+
+        SQLite's data_version moves whenever another connection commits, so
+        it catches writes that land within the mtime's resolution.
+        """
+        mtime = self._db_mtime()
+        if mtime is None:
+            return
+        version = (mtime, self.conn.execute("PRAGMA data_version").fetchone()[0])
+        if version != self._cache_version:
+            self._cache_version = version
+            self._clear_caches()
+
+    def _clear_caches(self) -> None:
+        """Reset in-process caches derived from the database and storage dir."""
+        _resolve_pdf_path.cache_clear()
+        self._item_cache.clear()
+        self._collections_cache = None
+        self._item_count = None
+        self._storage_keys = self._scan_storage_keys()
+
+    def _scan_storage_keys(self) -> FrozenSet[str]:
+        """List attachment directories under storage/ with one scandir call.
+
+        storage/ only holds per-attachment key directories, so entries are
+        not type-checked: is_dir() can cost a stat per entry on filesystems
+        that do not report entry types.
+        """
+        try:
+            with os.scandir(self.data_dir / "storage") as entries:
+                return frozenset(e.name for e in entries)
+        except OSError:
+            return frozenset()
 
     def is_available(self) -> bool:
         """Check if the database is accessible."""
@@ -175,7 +546,14 @@ class ZoteroDb:
             return False
 
     def item_count(self) -> int:
-        """Count items excluding attachments, notes, and deleted items."""
+        """Count items excluding attachments, notes, and deleted items.
+
+        The count is cached until the database changes.
+        """
+        self._check_db_changed()
+        if self._item_count is not None:
+            return self._item_count
+
         row = self.conn.execute(
             """
             SELECT COUNT(*)
@@ -185,63 +563,92 @@ class ZoteroDb:
               AND i.itemID NOT IN (SELECT itemID FROM deletedItems)
             """
         ).fetchone()
-        return row[0] if row else 0
+        self._item_count = row[0] if row else 0
+        return self._item_count
 
     def search_items(self, query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> List[Dict[str, Any]]:
         """Search for items matching the query with fuzzy/keyword matching.
 
         Tokenizes query into keywords and searches across title, abstract,
-        creators, tags, DOI, and citation key. Results are ranked by
-        relevance: exact > substring > fuzzy, with items matching all
-        tokens ranked higher.
+        creators, tags, DOI, and citation key. Word/prefix matches are served
+        from the FTS5 index, items matching all tokens first and then by
+        bm25; if that yields nothing, a substring search ranks results
+        exact > substring > fuzzy, with items matching all tokens ranked
+        higher.
         """
         tokens = _tokenize_query(query)
         if not tokens:
             return []
 
-        # Build SQL with one LIKE condition per token (OR across tokens)
-        conditions = []
-        params = []
-
-        for token in tokens:
-            pattern = f"%{_escape_like(token)}%"
-            conditions.append(
-                """(
-                    (f.fieldName IN ('title', 'shortTitle', 'publicationTitle')
-                        AND idv.value LIKE ? ESCAPE '\\')
-                    OR (f.fieldName = 'abstractNote' AND idv.value LIKE ? ESCAPE '\\')
-                    OR (f.fieldName = 'DOI' AND idv.value LIKE ? ESCAPE '\\')
-                    OR c.lastName LIKE ? ESCAPE '\\'
-                    OR c.firstName LIKE ? ESCAPE '\\'
-                    OR t.name LIKE ? ESCAPE '\\'
-                )"""
-            )
-            # Each condition references the pattern 6 times
-            params.extend([pattern] * 6)
-
-        where_clause = " OR ".join(conditions)
-        candidate_limit = limit * 5
-
-        sql = f"""
-            SELECT DISTINCT i.itemID, i.key, it.typeName
-            FROM items i
-            JOIN itemTypes it ON i.itemTypeID = it.itemTypeID
-            LEFT JOIN itemData id ON i.itemID = id.itemID
-            LEFT JOIN itemDataValues idv ON id.valueID = idv.valueID
-            LEFT JOIN fields f ON id.fieldID = f.fieldID
-            LEFT JOIN itemCreators ic ON i.itemID = ic.itemID
-            LEFT JOIN creators c ON ic.creatorID = c.creatorID
-            LEFT JOIN itemTags itag ON i.itemID = itag.itemID
-            LEFT JOIN tags t ON itag.tagID = t.tagID
-            WHERE it.typeName NOT IN ('attachment', 'note', 'annotation')
-              AND i.itemID NOT IN (SELECT itemID FROM deletedItems)
-              AND ({where_clause})
-            ORDER BY i.dateModified DESC
+        if self._sync_fts_index():
+            terms = _fts_match_terms(tokens)
+            if terms:
+                sql = self._fts_stmts.get(len(terms))
+                if sql is None:
+                    sql = self._fts_stmts[len(terms)] = self._fts_sql(len(terms))
+                params = [match for term in terms for match in (term + "*", term)]
+                try:
+                    rows = self.conn.execute(sql, [*params, limit]).fetchall()
+                except sqlite3.OperationalError:
+                    rows = []
+                if rows:
+                    item_rows = [(row[0], row[1], row[2]) for row in rows]
+                    return self._build_items_batch(item_rows, [row[0] for row in rows])
+
+        # No index, or no whole-word/prefix hits: fall back to substring
+        # matching with Python-side fuzzy scoring
+        return self._search_items_like(tokens, limit)
+
+    def _fts_sql(self, n_terms: int) -> str:
+        """Build the FTS5 search SQL for ``n_terms`` query terms.
+
+        Each term is matched on its own, as a prefix in items_fts and as a
+        whole word in items_stem, so that items containing every term rank
+        first, then by their summed bm25 score (lower is better).
+        items_flat carries key and type, so the ranked hits are ready for
+        hydration without another lookup.
+        """
+        hits = "\n                UNION ALL\n".join(
+            f"""SELECT rowid AS itemID, {term} AS term,
+                    bm25({table}, {FTS_BM25_WEIGHTS}) AS rank
+                FROM fts.{table} WHERE {table} MATCH ?"""
+            for term in range(n_terms)
+            for table in ("items_fts", "items_stem")
+        )
+        # A term's score is its better match of the prefix and stemmed forms
+        return f"""
+            SELECT fl.itemID, fl.key, fl.item_type
+            FROM (
+                SELECT itemID, MIN(rank) AS rank
+                FROM (
+                {hits}
+                )
+                GROUP BY itemID, term
+            ) AS terms
+            JOIN fts.items_flat fl ON fl.itemID = terms.itemID
+            GROUP BY fl.itemID
+            ORDER BY COUNT(*) DESC, SUM(terms.rank)
             LIMIT ?
         """
-        params.append(candidate_limit)
 
-        rows = self.conn.execute(sql, params).fetchall()
+    def _search_items_like(self, tokens: List[str], limit: int) -> List[Dict[str, Any]]:
+        """Substring search across title, authors, tags, DOI and abstract.
+
+        SQL computes a coarse weighted hit count per item so that only the
+        top ``limit`` candidates are hydrated; those are then re-ranked with
+        the full Python scoring (exact/word/substring/fuzzy). When the
+        sidecar index is available this scans the single items_flat table,
+        otherwise it joins Zotero's own tables.
+        """
+        flat = self._sync_fts_index()
+        try:
+            rows = self._like_rows(flat, tokens, limit)
+        except sqlite3.OperationalError:
+            if not flat:
+                raise
+            # Sidecar unreadable (e.g. locked while another server process
+            # rebuilds it): scan Zotero's own tables instead
+            rows = self._like_rows(False, tokens, limit)
         if not rows:
             return []
 
@@ -250,15 +657,100 @@ class ZoteroDb:
 
         items = self._build_items_batch(item_rows, item_ids)
 
-        # Score and rank
+        # Re-rank the window with the full scoring
         scored = [(self._score_item(item, tokens), item) for item in items]
         scored = [(s, item) for s, item in scored if s > 0.0]
         scored.sort(key=lambda x: x[0], reverse=True)
 
-        return [item for _, item in scored[:limit]]
+        return [item for _, item in scored]
+
+    def _like_rows(self, flat: bool, tokens: List[str], limit: int) -> List[sqlite3.Row]:
+        """Run the cached substring search SQL for ``tokens``."""
+        stmt_key = (flat, len(tokens))
+        sql = self._like_stmts.get(stmt_key)
+        if sql is None:
+            sql = self._like_stmts[stmt_key] = self._like_sql(*stmt_key)
+        # items_flat tests every token against 7 columns, the join against 3
+        params = [*tokens * (7 if flat else 3), limit]
+        return self.conn.execute(sql, params).fetchall()
+
+    def _like_sql(self, flat: bool, n_tokens: int) -> str:
+        """Build the substring search SQL for ``n_tokens`` tokens.
+
+        The SQL depends only on the token count and on whether the
+        items_flat sidecar is available, so callers cache it per pair.
+        """
+        # One instr() test per token; each column/branch multiplies the
+        # number of tokens found in its value by the field weight
+        def hits(value: str) -> str:
+            return " + ".join([f"(instr({value}, ?) > 0)"] * n_tokens)
+
+        if flat:
+            return f"""
+                SELECT itemID, key, item_type
+                FROM (
+                    SELECT itemID, key, item_type, date_modified,
+                           3.0 * ({hits("title_lc")})
+                           + 1.0 * ({hits("publication_lc")})
+                           + 1.0 * ({hits("abstract_lc")})
+                           + 2.0 * ({hits("doi_lc")})
+                           + 2.0 * ({hits("authors_lc")})
+                           + 1.5 * ({hits("tags_lc")})
+                           + 3.0 * ({hits("citekey_lc")}) AS score
+                    FROM fts.items_flat
+                )
+                WHERE score > 0
+                ORDER BY score DESC, date_modified DESC
+                LIMIT ?
+            """
+        author = "lower(ifnull(c.firstName, '') || ' ' || ifnull(c.lastName, ''))"
+        return f"""
+            WITH hits(itemID, score) AS (
+                SELECT id.itemID,
+                       CASE f.fieldName
+                           WHEN 'title' THEN 3.0
+                           WHEN 'shortTitle' THEN 3.0
+                           WHEN 'DOI' THEN 2.0
+                           ELSE 1.0
+                       END * ({hits("lower(idv.value)")})
+                FROM itemData id
+                JOIN fields f ON id.fieldID = f.fieldID
+                JOIN itemDataValues idv ON id.valueID = idv.valueID
+                WHERE f.fieldName IN ('title', 'shortTitle', 'publicationTitle',
+                                      'abstractNote', 'DOI')
+                UNION ALL
+                SELECT ic.itemID,
+                       2.0 * ({hits(author)})
+                FROM itemCreators ic
+                JOIN creators c ON ic.creatorID = c.creatorID
+                UNION ALL
+                SELECT itag.itemID, 1.5 * ({hits("lower(t.name)")})
+                FROM itemTags itag
+                JOIN tags t ON itag.tagID = t.tagID
+            )
+            SELECT i.itemID, i.key, it.typeName, SUM(h.score) AS score
+            FROM hits h
+            JOIN items i ON h.itemID = i.itemID
+            JOIN itemTypes it ON i.itemTypeID = it.itemTypeID
+            WHERE h.score > 0
+              AND it.typeName NOT IN ('attachment', 'note', 'annotation')
+              AND i.itemID NOT IN (SELECT itemID FROM deletedItems)
+            GROUP BY i.itemID
+            ORDER BY score DESC, i.dateModified DESC
+            LIMIT ?
+        """
 
     def get_item(self, key: str) -> Optional[Dict[str, Any]]:
-        """Get a single item by its Zotero key."""
+        """Get a single item by its Zotero key.
+
+        Results are cached until the database file changes on disk.
+        """
+        self._check_db_changed()
+        item = self._item_cache.get(key)
+        if item is not None:
+            self._item_cache.move_to_end(key)
+            return item
+
         row = self.conn.execute(
             """
             SELECT i.itemID, i.key, it.typeName
@@ -276,7 +768,13 @@ class ZoteroDb:
         items = self._build_items_batch(
             [(row[0], row[1], row[2])], [row[0]]
         )
-        return items[0] if items else None
+        if not items:
+            return None
+
+        self._item_cache[key] = items[0]
+        if len(self._item_cache) > ITEM_CACHE_SIZE:
+            self._item_cache.popitem(last=False)
+        return items[0]
 
     def get_bibtex(self, key: str) -> Optional[str]:
         """Generate a BibTeX entry for an item."""
@@ -284,87 +782,17 @@ class ZoteroDb:
         if not item:
             return None
 
-        citation_key = item.get("citation_key") or item["key"]
-        entry_type = _map_item_type_to_bibtex(item["item_type"])
-
-        lines = [f"@{entry_type}{{{citation_key},"]
-
-        if item["title"]:
-            lines.append(f"  title = {{{_escape_bibtex(item['title'])}}},")
-
-        # Authors
-        authors = [
-            c for c in item["creators"] if c["creator_type"] == "author"
-        ]
-        if authors:
-            author_strs = []
-            for a in authors:
-                if a["first_name"]:
-                    author_strs.append(f"{a['last_name']}, {a['first_name']}")
-                else:
-                    author_strs.append(a["last_name"])
-            lines.append(f"  author = {{{' and '.join(author_strs)}}},")
-
-        # Editors
-        editors = [
-            c for c in item["creators"] if c["creator_type"] == "editor"
-        ]
-        if editors:
-            editor_strs = []
-            for e in editors:
-                if e["first_name"]:
-                    editor_strs.append(f"{e['last_name']}, {e['first_name']}")
-                else:
-                    editor_strs.append(e["last_name"])
-            lines.append(f"  editor = {{{' and '.join(editor_strs)}}},")
-
-        # Date/Year
-        if item.get("date"):
-            year = _extract_year(item["date"])
-            if year:
-                lines.append(f"  year = {{{year}}},")
-
-        # Journal
-        if item.get("journal") and item["item_type"] == "journalArticle":
-            lines.append(f"  journal = {{{_escape_bibtex(item['journal'])}}},")
-
-        # Booktitle
-        if item.get("booktitle"):
-            lines.append(f"  booktitle = {{{_escape_bibtex(item['booktitle'])}}},")
-
-        # Publisher
-        if item.get("publisher"):
-            lines.append(f"  publisher = {{{_escape_bibtex(item['publisher'])}}},")
-
-        # Volume
-        if item.get("volume"):
-            lines.append(f"  volume = {{{item['volume']}}},")
-
-        # Number
-        if item.get("number"):
-            lines.append(f"  number = {{{item['number']}}},")
-
-        # Pages
-        if item.get("pages"):
-            lines.append(f"  pages = {{{item['pages']}}},")
-
-        # DOI
-        if item.get("doi"):
-            lines.append(f"  doi = {{{item['doi']}}},")
+        return _render_bibtex(item)
 
-        # URL
-        if item.get("url"):
-            lines.append(f"  url = {{{item['url']}}},")
-
-        # Abstract
-        if item.get("abstract_text"):
-            lines.append(f"  abstract = {{{_escape_bibtex(item['abstract_text'])}}},")
+    def list_collections(self) -> List[Dict[str, Any]]:
+        """List all collections.
 
-        lines.append("}")
-        return "\n".join(lines) + "\n"
+        The result is cached until the database changes.
+        """
+        self._check_db_changed()
+        if self._collections_cache is not None:
+            return self._collections_cache
 
-    def list_collections(self) -> List[Dict[str, Any]]:
-        """List all collections."""
         rows = self.conn.execute(
             """
             SELECT c.key, c.collectionName, pc.key as parentKey
@@ -374,7 +802,7 @@ class ZoteroDb:
             """
         ).fetchall()
 
-        return [
+        self._collections_cache = [
             {
                 "key": row[0],
                 "name": row[1],
@@ -382,6 +810,7 @@ class ZoteroDb:
             }
             for row in rows
         ]
+        return self._collections_cache
 
     def get_collection_items(
         self, collection_key: str, limit: int = 50
@@ -440,12 +869,15 @@ class ZoteroDb:
         if not item_ids:
             return []
 
-        fields_map = self._batch_get_fields(item_ids)
-        creators_map = self._batch_get_creators(item_ids)
-        tags_map = self._batch_get_tags(item_ids)
-        collections_map = self._batch_get_collections(item_ids)
-        pdf_map = self._batch_get_pdf_paths(item_ids)
-        citation_keys_map = self._batch_get_citation_keys(item_ids)
+        self._check_db_changed()
+
+        data = self._batch_get_item_data(item_ids)
+        fields_map = data["fields"]
+        creators_map = data["creators"]
+        tags_map = data["tags"]
+        collections_map = data["collections"]
+        pdf_map = data["pdfs"]
+        citation_keys_map = data["citation_keys"]
 
         items = []
         for item_id, key, item_type in item_rows:
@@ -453,7 +885,8 @@ class ZoteroDb:
             creators = creators_map.get(item_id, [])
             tags = tags_map.get(item_id, [])
             collections = collections_map.get(item_id, [])
-            pdf_path = pdf_map.get(item_id)
+            pdf = pdf_map.get(item_id)
+            pdf_path = self._pdf_path(*pdf) if pdf else None
             citation_key = citation_keys_map.get(item_id)
 
             # Resolve booktitle for conference papers
@@ -484,98 +917,100 @@ class ZoteroDb:
 
         return items
 
-    def _placeholders(self, ids: List[int]) -> str:
-        """Build SQL placeholder string for IN clause."""
-        return ",".join("?" for _ in ids)
-
-    def _batch_get_fields(self, item_ids: List[int]) -> Dict[int, Dict[str, str]]:
-        ph = self._placeholders(item_ids)
-        rows = self.conn.execute(
-            f"""
-            SELECT id.itemID, f.fieldName, idv.value
-            FROM itemData id
-            JOIN fields f ON id.fieldID = f.fieldID
-            JOIN itemDataValues idv ON id.valueID = idv.valueID
-            WHERE id.itemID IN ({ph})
-            """,
-            item_ids,
-        ).fetchall()
-
-        result: Dict[int, Dict[str, str]] = {}
-        for row in rows:
-            result.setdefault(row[0], {})[row[1]] = row[2]
-        return result
-
-    def _batch_get_creators(self, item_ids: List[int]) -> Dict[int, List[Dict[str, str]]]:
-        ph = self._placeholders(item_ids)
-        rows = self.conn.execute(
-            f"""
-            SELECT ic.itemID, c.firstName, c.lastName, ct.creatorType
-            FROM itemCreators ic
-            JOIN creators c ON ic.creatorID = c.creatorID
-            JOIN creatorTypes ct ON ic.creatorTypeID = ct.creatorTypeID
-            WHERE ic.itemID IN ({ph})
-            ORDER BY ic.itemID, ic.orderIndex
-            """,
-            item_ids,
-        ).fetchall()
+    def _batch_rows(self, name: str, item_ids: List[int]) -> List[sqlite3.Row]:
+        """Run a named batch query over item_ids.
 
-        result: Dict[int, List[Dict[str, str]]] = {}
-        for row in rows:
-            result.setdefault(row[0], []).append({
-                "first_name": row[1] or "",
-                "last_name": row[2] or "",
-                "creator_type": row[3],
-            })
-        return result
+        The ID list is split into chunks of at most the largest bucket and
+        each chunk is padded up to the next bucket size, so only a fixed set
+        of prepared statements is ever used.
+        """
+        largest = IN_LIST_BUCKETS[-1]
+        rows: List[sqlite3.Row] = []
+        for start in range(0, len(item_ids), largest):
+            chunk = list(item_ids[start:start + largest])
+            bucket = next(b for b in IN_LIST_BUCKETS if b >= len(chunk))
+            chunk.extend([IN_LIST_PAD] * (bucket - len(chunk)))
+            rows.extend(self.conn.execute(self._stmts[(name, bucket)], chunk).fetchall())
+        return rows
+
+    def _pdf_path(self, path: str, attachment_key: str) -> Optional[Path]:
+        """Resolve an attachment path to an existing file, if any.
+
+        Stored files whose attachment directory is missing (e.g. not yet
+        synced) are rejected without touching the filesystem.
+        """
+        if path.startswith("storage:") and attachment_key not in self._storage_keys:
+            return None
+        return _resolve_pdf_path(str(self.data_dir), path, attachment_key)
 
-    def _batch_get_tags(self, item_ids: List[int]) -> Dict[int, List[str]]:
-        ph = self._placeholders(item_ids)
-        rows = self.conn.execute(
-            f"""
-            SELECT it.itemID, t.name
-            FROM itemTags it
-            JOIN tags t ON it.tagID = t.tagID
-            WHERE it.itemID IN ({ph})
-            """,
-            item_ids,
-        ).fetchall()
+    def _batch_get_item_data(self, item_ids: List[int]) -> Dict[str, Dict[int, Any]]:
+        """Fetch fields, creators, tags, collections, PDFs and citation keys.
 
-        result: Dict[int, List[str]] = {}
-        for row in rows:
-            result.setdefault(row[0], []).append(row[1])
-        return result
+        Everything but the Better BibTeX keys comes from a single query; the
+        keys are read from the attached ``bbt`` database and skipped if it
+        cannot be read. PDF entries are the raw
+        (path, attachment_key) of the first PDF attachment and are resolved
+        by the caller.
+        """
+        fields_map: Dict[int, Dict[str, str]] = {}
+        creators_map: Dict[int, List[tuple]] = {}
+        tags_map: Dict[int, List[str]] = {}
+        collections_map: Dict[int, List[str]] = {}
+        pdf_map: Dict[int, tuple] = {}
+        bbt_keys: Dict[int, str] = {}
+
+        for item_id, kind, a, b, c, order in self._batch_rows("item_data", item_ids):
+            if kind == "field":
+                fields_map.setdefault(item_id, {})[a] = b
+            elif kind == "creator":
+                creators_map.setdefault(item_id, []).append((order, a, b, c))
+            elif kind == "tag":
+                tags_map.setdefault(item_id, []).append(a)
+            elif kind == "collection":
+                collections_map.setdefault(item_id, []).append(a)
+            elif kind == "pdf" and a and item_id not in pdf_map:
+                pdf_map[item_id] = (a, b)  # Take first PDF only
 
-    def _batch_get_collections(self, item_ids: List[int]) -> Dict[int, List[str]]:
-        ph = self._placeholders(item_ids)
-        rows = self.conn.execute(
-            f"""
-            SELECT ci.itemID, c.collectionName
-            FROM collectionItems ci
-            JOIN collections c ON ci.collectionID = c.collectionID
-            WHERE ci.itemID IN ({ph})
-            """,
-            item_ids,
-        ).fetchall()
+        try:
+            for item_id, citation_key in self._batch_rows("bbt_keys", item_ids):
+                if citation_key:
+                    bbt_keys[item_id] = citation_key
+        except sqlite3.Error:
+            pass  # BBT database locked or without the expected schema
+
+        creators_result: Dict[int, List[Dict[str, str]]] = {
+            item_id: [
+                {
+                    "first_name": first or "",
+                    "last_name": last or "",
+                    "creator_type": creator_type,
+                }
+                for _, first, last, creator_type in sorted(rows, key=lambda r: r[0])
+            ]
+            for item_id, rows in creators_map.items()
+        }
 
-        result: Dict[int, List[str]] = {}
-        for row in rows:
-            result.setdefault(row[0], []).append(row[1])
-        return result
+        # Citation key from the extra field (Citation Key: or bibtex: prefix)
+        # takes precedence over the Better BibTeX database
+        citation_keys: Dict[int, Optional[str]] = dict(bbt_keys)
+        for item_id, fields in fields_map.items():
+            if fields.get("extra"):
+                key = _extract_citation_key_from_extra(fields["extra"])
+                if key:
+                    citation_keys[item_id] = key
+
+        return {
+            "fields": fields_map,
+            "creators": creators_result,
+            "tags": tags_map,
+            "collections": collections_map,
+            "pdfs": pdf_map,
+            "citation_keys": citation_keys,
+        }
 
     def _batch_get_pdf_paths(self, item_ids: List[int]) -> Dict[int, Optional[Path]]:
-        ph = self._placeholders(item_ids)
-        rows = self.conn.execute(
-            f"""
-            SELECT ia.parentItemID, ia.path, i.key
-            FROM itemAttachments ia
-            JOIN items i ON ia.itemID = i.itemID
-            WHERE ia.parentItemID IN ({ph})
-              AND ia.contentType = 'application/pdf'
-              AND ia.itemID NOT IN (SELECT itemID FROM deletedItems)
-            """,
-            item_ids,
-        ).fetchall()
+        self._check_db_changed()
+        rows = self._batch_rows("pdf_paths", item_ids)
 
         result: Dict[int, Optional[Path]] = {}
         for row in rows:
@@ -583,63 +1018,217 @@ class ZoteroDb:
             if parent_id in result:
                 continue  # Take first PDF only
             if path_str:
-                resolved = self._resolve_pdf_path(path_str, attachment_key)
+                resolved = self._pdf_path(path_str, attachment_key)
                 result[parent_id] = resolved
         return result
 
-    def _resolve_pdf_path(self, path: str, attachment_key: str) -> Optional[Path]:
-        """Resolve Zotero storage:filename paths to absolute paths."""
-        if path.startswith("storage:"):
-            filename = path[len("storage:"):]
-            resolved = self.data_dir / "storage" / attachment_key / filename
-        else:
-            resolved = Path(path)
-
-        return resolved if resolved.exists() else None
-
-    def _batch_get_citation_keys(self, item_ids: List[int]) -> Dict[int, Optional[str]]:
-        """Get citation keys from extra field and Better BibTeX database."""
-        ph = self._placeholders(item_ids)
+    # -------------------------------------------------------------------
+    # Search index (FTS5 + flat sidecar database)
+    # -------------------------------------------------------------------
 
-        # Try the extra field first (Citation Key: or bibtex: prefix)
-        rows = self.conn.execute(
-            f"""
-            SELECT id.itemID, idv.value
-            FROM itemData id
-            JOIN fields f ON id.fieldID = f.fieldID
-            JOIN itemDataValues idv ON id.valueID = idv.valueID
-            WHERE id.itemID IN ({ph}) AND f.fieldName = 'extra'
-            """,
-            item_ids,
-        ).fetchall()
+    def _sync_fts_index(self) -> bool:
+        """Make sure the sidecar search index matches the Zotero database.
 
-        result: Dict[int, Optional[str]] = {}
-        for row in rows:
-            key = _extract_citation_key_from_extra(row[1])
-            if key:
-                result[row[0]] = key
-
-        # Try Better BibTeX database for items missing citation keys
-        bbt_db_path = self.data_dir / "better-bibtex.sqlite"
-        if bbt_db_path.exists():
-            missing_ids = [id for id in item_ids if id not in result]
-            if missing_ids:
-                try:
-                    bbt_conn = sqlite3.connect(
-                        f"file:{bbt_db_path}?mode=ro", uri=True
+        Rebuilds the sidecar (items_fts, items_stem and items_flat) when the
+        database changes and attaches it to the main connection as ``fts``.
+        Returns False if the index is unavailable (no FTS5 support,
+        unwritable cache dir, ...).
+        """
+        data_version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        if self._fts_version is not None and data_version != self._fts_version[1]:
+            # Another connection committed: re-stat so the rebuild records the
+            # post-commit mtime, not one cached up to DB_STAT_TTL earlier that
+            # would trigger a second rebuild once the cache expires
+            self._mtime_checked_at = None
+        mtime = self._db_mtime()
+        if mtime is None:
+            return False
+        version = (mtime, data_version)
+        if version == self._fts_version:
+            return self._fts_ready
+
+        # A commit the mtime did not show (same second, or within
+        # DB_STAT_TTL): the sidecar's meta still looks current, so rebuild
+        # regardless
+        force = self._fts_version is not None and mtime == self._fts_version[0]
+        self._fts_version = version
+        try:
+            self._build_fts_index(mtime, force)
+            attached = {row[1] for row in self.conn.execute("PRAGMA database_list")}
+            if "fts" not in attached:
+                self.conn.execute(
+                    "ATTACH DATABASE ? AS fts", (f"file:{self.fts_path}?mode=ro",)
+                )
+            self._fts_ready = True
+        except (sqlite3.Error, OSError) as e:
+            print(
+                f"Warning: full-text index unavailable ({e}); using substring search",
+                file=sys.stderr,
+            )
+            self._fts_ready = False
+        return self._fts_ready
+
+    def _build_fts_index(self, mtime: float, force: bool = False) -> None:
+        """(Re)build the sidecar search tables unless current for this mtime."""
+        self.fts_path.parent.mkdir(parents=True, exist_ok=True)
+        # Autocommit mode, so the explicit BEGIN below covers the DDL too:
+        # the legacy implicit transactions commit each DROP/CREATE on its own
+        fts_conn = sqlite3.connect(self.fts_path, isolation_level=None)
+        try:
+            fts_conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)"
+            )
+            # One transaction for the check and the whole rebuild: other
+            # servers on this library keep reading the previous index until
+            # COMMIT, a concurrent rebuild waits and then finds meta current,
+            # and an interrupted rebuild leaves the old index and meta intact
+            fts_conn.execute("BEGIN IMMEDIATE")
+            meta = dict(fts_conn.execute("SELECT name, value FROM meta").fetchall())
+            if (
+                not force
+                and meta.get("version") == FTS_INDEX_VERSION
+                and meta.get("db_path") == str(self.db_path)
+                and meta.get("db_mtime") == repr(mtime)
+            ):
+                return
+
+            item_rows = [
+                (row[0], row[1], row[2], row[3])
+                for row in self.conn.execute(
+                    """
+                    SELECT i.itemID, i.key, it.typeName, i.dateModified
+                    FROM items i
+                    JOIN itemTypes it ON i.itemTypeID = it.itemTypeID
+                    WHERE it.typeName NOT IN ('attachment', 'note', 'annotation')
+                      AND i.itemID NOT IN (SELECT itemID FROM deletedItems)
+                    """
+                ).fetchall()
+            ]
+
+            fts_conn.execute("DROP TABLE IF EXISTS items_fts")
+            fts_conn.execute(
+                f"""
+                CREATE VIRTUAL TABLE items_fts USING fts5(
+                    title, abstract, creators, tags, doi, citekey, publication,
+                    content='', prefix='{FTS_PREFIX_LENGTHS}',
+                    tokenize='{FTS_TOKENIZER}'
+                )
+                """
+            )
+            # Same columns, stemmed; only queried with whole words
+            fts_conn.execute("DROP TABLE IF EXISTS items_stem")
+            fts_conn.execute(
+                f"""
+                CREATE VIRTUAL TABLE items_stem USING fts5(
+                    title, abstract, creators, tags, doi, citekey, publication,
+                    content='', tokenize='{FTS_STEM_TOKENIZER}'
+                )
+                """
+            )
+            # Lowercased, denormalized copy of the searchable columns for
+            # substring search: one table scan instead of a 6-way join
+            fts_conn.execute("DROP TABLE IF EXISTS items_flat")
+            fts_conn.execute(
+                """
+                CREATE TABLE items_flat (
+                    itemID INTEGER PRIMARY KEY,
+                    key TEXT,
+                    item_type TEXT,
+                    date_modified TEXT,
+                    title_lc TEXT,
+                    publication_lc TEXT,
+                    abstract_lc TEXT,
+                    doi_lc TEXT,
+                    authors_lc TEXT,
+                    tags_lc TEXT,
+                    citekey_lc TEXT
+                )
+                """
+            )
+            for start in range(0, len(item_rows), FTS_BUILD_BATCH):
+                fts_rows, flat_rows = self._index_rows(
+                    item_rows[start:start + FTS_BUILD_BATCH]
+                )
+                for table in ("items_fts", "items_stem"):
+                    fts_conn.executemany(
+                        f"""
+                        INSERT INTO {table}(
+                            rowid, title, abstract, creators, tags, doi, citekey, publication
+                        )
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                        """,
+                        fts_rows,
                     )
-                    ph2 = ",".join("?" for _ in missing_ids)
-                    bbt_rows = bbt_conn.execute(
-                        f"SELECT itemID, citationKey FROM citationkey WHERE itemID IN ({ph2})",
-                        missing_ids,
-                    ).fetchall()
-                    for row in bbt_rows:
-                        result[row[0]] = row[1]
-                    bbt_conn.close()
-                except Exception:
-                    pass  # BBT database may not have the expected schema
+                fts_conn.executemany(
+                    "INSERT INTO items_flat VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    flat_rows,
+                )
+            fts_conn.executemany(
+                "INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)",
+                [
+                    ("version", FTS_INDEX_VERSION),
+                    ("db_path", str(self.db_path)),
+                    ("db_mtime", repr(mtime)),
+                ],
+            )
+            fts_conn.execute("COMMIT")
+        finally:
+            if fts_conn.in_transaction:
+                fts_conn.execute("ROLLBACK")
+            fts_conn.close()
 
-        return result
+    def _index_rows(self, item_rows: List[tuple]) -> Tuple[List[tuple], List[tuple]]:
+        """Build full-text and items_flat rows for a batch of items.
+
+        ``item_rows`` are (itemID, key, typeName, dateModified) tuples.
+        """
+        data = self._batch_get_item_data([row[0] for row in item_rows])
+        fields_map = data["fields"]
+        creators_map = data["creators"]
+        tags_map = data["tags"]
+        citation_keys_map = data["citation_keys"]
+
+        fts_rows = []
+        flat_rows = []
+        for item_id, key, item_type, date_modified in item_rows:
+            fields = fields_map.get(item_id, {})
+            title = "\n".join(
+                fields[name] for name in ("title", "shortTitle") if fields.get(name)
+            )
+            publication = fields.get("publicationTitle") or ""
+            abstract = fields.get("abstractNote") or ""
+            creators = "\n".join(
+                f"{c['first_name']} {c['last_name']}".strip()
+                for c in creators_map.get(item_id, [])
+            )
+            tags = "\n".join(tags_map.get(item_id, []))
+            doi = fields.get("DOI") or ""
+            citekey = citation_keys_map.get(item_id) or ""
+
+            fts_rows.append((
+                item_id,
+                title,
+                abstract,
+                creators,
+                tags,
+                doi,
+                citekey,
+                publication,
+            ))
+            flat_rows.append((
+                item_id,
+                key,
+                item_type,
+                date_modified,
+                title.lower(),
+                publication.lower(),
+                abstract.lower(),
+                doi.lower(),
+                creators.lower(),
+                tags.lower(),
+                citekey.lower(),
+            ))
+        return fts_rows, flat_rows
 
     # -------------------------------------------------------------------
     # Scoring and ranking (mirrors src/zotero.rs scoring logic)
@@ -650,35 +1239,24 @@ class ZoteroDb:
         if not tokens:
             return 0.0
 
+        # Lowercase and split each searchable field once per item instead of
+        # once per token; the joined blob gives a single substring pre-check
+        fields = _searchable_fields(item)
+        blob = "\n".join(field[0] for field, _ in fields)
+
         total_score = 0.0
         tokens_matched = 0
 
         for token in tokens:
             best = 0.0
 
-            # Title (weight 3x)
-            best = max(best, _score_field(token, item["title"]) * 3.0)
-
-            # Citation key (weight 3x)
-            if item.get("citation_key"):
-                best = max(best, _score_field(token, item["citation_key"]) * 3.0)
-
-            # DOI (weight 2x)
-            if item.get("doi"):
-                best = max(best, _score_field(token, item["doi"]) * 2.0)
-
-            # Authors (weight 2x)
-            for c in item.get("creators", []):
-                best = max(best, _score_field(token, c["last_name"]) * 2.0)
-                best = max(best, _score_field(token, c["first_name"]) * 2.0)
-
-            # Tags (weight 1.5x)
-            for tag in item.get("tags", []):
-                best = max(best, _score_field(token, tag) * 1.5)
-
-            # Abstract (weight 1x)
-            if item.get("abstract_text"):
-                best = max(best, _score_field(token, item["abstract_text"]))
+            if token in blob:
+                for field, weight in fields:
+                    best = max(best, _score_field(token, field) * weight)
+            else:
+                # No field contains the token, so only fuzzy matches remain
+                for field, weight in fields:
+                    best = max(best, _fuzzy_score(token, field) * weight)
 
             if best > 0.0:
                 tokens_matched += 1
@@ -705,39 +1283,85 @@ def _tokenize_query(query: str) -> List[str]:
     return [t.lower() for t in query.split() if t.strip()]
 
 
-def _escape_like(s: str) -> str:
-    """Escape special chars in SQL LIKE patterns."""
-    return s.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+def _fts_match_terms(tokens: List[str]) -> List[str]:
+    """Build one quoted FTS5 MATCH string per token (append ``*`` for a prefix).
+
+    Quoting keeps FTS5 operators (AND, NEAR, ``*``, ``-``...) in user input
+    literal. Tokens without any word characters are dropped.
+    """
+    return [
+        '"' + token.replace('"', '""') + '"'
+        for token in tokens
+        if re.search(r"\w", token)
+    ]
+
+
+# A lowercased field value and the set of words in it
+SearchField = Tuple[str, FrozenSet[str]]
+
+
+def _searchable_fields(item: Dict[str, Any]) -> List[Tuple[SearchField, float]]:
+    """Lowercased, pre-split searchable values of an item with their weight.
 
+    Weights: title and citation key 3x, DOI and authors 2x, tags 1.5x,
+    abstract 1x. Empty values are skipped.
+    """
+    values = [
+        (item.get("title"), 3.0),
+        (item.get("citation_key"), 3.0),
+        (item.get("doi"), 2.0),
+    ]
+    for c in item.get("creators", []):
+        values.append((c["last_name"], 2.0))
+        values.append((c["first_name"], 2.0))
+    values.extend((tag, 1.5) for tag in item.get("tags", []))
+    values.append((item.get("abstract_text"), 1.0))
+
+    fields = []
+    for value, weight in values:
+        if value:
+            fl = value.lower()
+            words = frozenset(w for w in _WORD_SPLIT.split(fl) if w)
+            fields.append(((fl, words), weight))
+    return fields
 
-def _score_field(token: str, field: str) -> float:
-    """Score how well a token matches a field value.
+
+def _score_field(token: str, field: SearchField) -> float:
+    """Score how well a lowercase token matches a field from _searchable_fields.
 
     Returns:
         10.0 for exact match
         8.0 for word-boundary match
         5.0 for substring match
-        0.0-3.0 for fuzzy match (trigram similarity, threshold 0.3)
+        0.0-3.0 for fuzzy match (see _fuzzy_score)
     """
-    if not field:
+    fl, words = field
+    if not fl:
         return 0.0
 
-    fl = field.lower()
-    tl = token.lower()
-
-    if fl == tl:
+    if fl == token:
         return 10.0
 
-    if tl in fl:
+    if token in fl:
         # Word boundary check
-        words = re.split(r"[^a-zA-Z0-9]+", fl)
-        if tl in words:
+        if token in words:
             return 8.0
         return 5.0
 
-    # Fuzzy: trigram similarity against each word
-    words = [w for w in re.split(r"[^a-zA-Z0-9]+", fl) if w]
-    best_sim = max((_trigram_similarity(tl, w) for w in words), default=0.0)
+    return _fuzzy_score(token, field)
+
+
+def _fuzzy_score(token: str, field: SearchField) -> float:
+    """Fuzzy-match score (0.0-3.0) of a lowercase token against a field.
+
+    Uses rapidfuzz partial_ratio, or trigram similarity against each word
+    (threshold 0.3) if rapidfuzz is missing.
+    """
+    fl, words = field
+    if fuzz is not None:
+        return fuzz.partial_ratio(token, fl, score_cutoff=FUZZY_SCORE_CUTOFF) / 100.0 * 3.0
+
+    best_sim = max((_trigram_similarity(token, w) for w in words), default=0.0)
     if best_sim >= 0.3:
         return best_sim * 3.0
 
@@ -745,15 +1369,21 @@ def _score_field(token: str, field: str) -> float:
 
 
 def _trigram_similarity(a: str, b: str) -> float:
-    """Dice coefficient on character trigrams."""
-    a_tri = _trigrams(a)
-    b_tri = _trigrams(b)
+    """Dice coefficient on character trigram multisets."""
+    a_tri = _trigram_counts(a)
+    b_tri = _trigram_counts(b)
     if not a_tri and not b_tri:
         return 1.0
     if not a_tri or not b_tri:
         return 0.0
-    intersection = len(set(a_tri) & set(b_tri))
-    return (2.0 * intersection) / (len(a_tri) + len(b_tri))
+    intersection = sum((a_tri & b_tri).values())
+    return (2.0 * intersection) / (sum(a_tri.values()) + sum(b_tri.values()))
+
+
+@lru_cache(maxsize=16384)
+def _trigram_counts(s: str) -> Counter:
+    """Trigram multiset of a string (cached; callers must not mutate it)."""
+    return Counter(_trigrams(s))
 
 
 def _trigrams(s: str) -> List[str]:
@@ -764,6 +1394,26 @@ def _trigrams(s: str) -> List[str]:
     return [padded[i : i + 3] for i in range(len(padded) - 2)]
 
 
+@lru_cache(maxsize=8192)
+def _resolve_pdf_path(data_dir: str, path: str, attachment_key: str) -> Optional[Path]:
+    """Resolve Zotero storage:filename paths to absolute paths.
+
+    Cached so repeated lookups of the same attachment skip the stat()
+    call. ZoteroDb clears the cache on refresh() and whenever the database
+    file changes (e.g. after Zotero downloads an attachment).
+
+    Callers go through ZoteroDb._pdf_path, which skips storage paths whose
+    attachment directory does not exist.
+    """
+    if path.startswith("storage:"):
+        filename = path[len("storage:"):]
+        resolved = Path(data_dir) / "storage" / attachment_key / filename
+    else:
+        resolved = Path(path)
+
+    return resolved if resolved.exists() else None
+
+
 def _extract_citation_key_from_extra(extra: str) -> Optional[str]:
     """Extract citation key from Zotero's extra field."""
     for line in extra.splitlines():
@@ -777,6 +1427,10 @@ def _extract_citation_key_from_extra(extra: str) -> Optional[str]:
 
 def _extract_year(date: str) -> Optional[str]:
     """Extract a 4-digit year from various date formats."""
+    # Zotero stores dates as "YYYY-MM-DD <original>"; take the year directly
+    if date[4:5] == "-" and date[:2] in ("19", "20") and date[2:4].isdecimal():
+        return date[:4]
+
     m = YEAR_REGEX.search(date)
     return m.group(0) if m else None
 
@@ -798,21 +1452,89 @@ def _map_item_type_to_bibtex(item_type: str) -> str:
     return mapping.get(item_type, "misc")
 
 
+# Single-pass translation table for BibTeX special characters
+_BIBTEX_ESCAPES = str.maketrans({
+    "&": r"\&",
+    "%": r"\%",
+    "$": r"\$",
+    "#": r"\#",
+    "_": r"\_",
+    "{": r"\{",
+    "}": r"\}",
+    "~": r"\textasciitilde{}",
+    "^": r"\textasciicircum{}",
+})
+
+
+# Any character that _BIBTEX_ESCAPES rewrites
+_BIBTEX_SPECIALS_RE = re.compile(r"[&%$#_{}~^]")
+
+
 def _escape_bibtex(s: str) -> str:
     """Escape special characters for BibTeX."""
-    return (
-        s.replace("&", r"\&")
-        .replace("%", r"\%")
-        .replace("$", r"\$")
-        .replace("#", r"\#")
-        .replace("_", r"\_")
-        .replace("{", r"\{")
-        .replace("}", r"\}")
-        .replace("~", r"\textasciitilde{}")
-        .replace("^", r"\textasciicircum{}")
+    # Most values contain none; a regex scan is cheaper than translate()
+    if not _BIBTEX_SPECIALS_RE.search(s):
+        return s
+    return s.translate(_BIBTEX_ESCAPES)
+
+
+# BibTeX entry layout; each field slot expands to a complete
+# "  name = {value},\n" line, or to nothing when the field is absent
+_BIBTEX_TEMPLATE = (
+    "@{entry_type}{{{citation_key},\n"
+    "{title}{author}{editor}{year}{journal}{booktitle}{publisher}"
+    "{volume}{number}{pages}{doi}{url}{abstract}"
+    "}}\n"
+)
+
+
+def _bibtex_names(creators: List[Dict[str, str]], creator_type: str) -> str:
+    """Join creators of one type as 'Last, First and Last, First'."""
+    return " and ".join(
+        f"{c['last_name']}, {c['first_name']}" if c["first_name"] else c["last_name"]
+        for c in creators
+        if c["creator_type"] == creator_type
     )
 
 
+def _render_bibtex(item: Dict[str, Any]) -> str:
+    """Render an item as a BibTeX entry."""
+    slots: Dict[str, str] = defaultdict(str)
+    slots["entry_type"] = _map_item_type_to_bibtex(item["item_type"])
+    slots["citation_key"] = item.get("citation_key") or item["key"]
+
+    if item["title"]:
+        slots["title"] = f"  title = {{{_escape_bibtex(item['title'])}}},\n"
+
+    authors = _bibtex_names(item["creators"], "author")
+    if authors:
+        slots["author"] = f"  author = {{{authors}}},\n"
+    editors = _bibtex_names(item["creators"], "editor")
+    if editors:
+        slots["editor"] = f"  editor = {{{editors}}},\n"
+
+    year = _extract_year(item["date"]) if item.get("date") else None
+    if year:
+        slots["year"] = f"  year = {{{year}}},\n"
+
+    if item.get("journal") and item["item_type"] == "journalArticle":
+        slots["journal"] = f"  journal = {{{_escape_bibtex(item['journal'])}}},\n"
+    if item.get("booktitle"):
+        slots["booktitle"] = f"  booktitle = {{{_escape_bibtex(item['booktitle'])}}},\n"
+    if item.get("publisher"):
+        slots["publisher"] = f"  publisher = {{{_escape_bibtex(item['publisher'])}}},\n"
+
+    # Emitted verbatim (no escaping)
+    for name in ("volume", "number", "pages", "doi", "url"):
+        if item.get(name):
+            slots[name] = f"  {name} = {{{item[name]}}},\n"
+
+    if item.get("abstract_text"):
+        slots["abstract"] = f"  abstract = {{{_escape_bibtex(item['abstract_text'])}}},\n"
+
+    return _BIBTEX_TEMPLATE.format_map(slots)
+
+
 # ---------------------------------------------------------------------------
 # Formatting helpers
 # ---------------------------------------------------------------------------
@@ -826,23 +1548,23 @@ def _format_item_summary(item: Dict[str, Any], index: Optional[int] = None) -> s
         for c in item.get("creators", [])
         if c.get("creator_type") == "author"
     )
-    date = item.get("date") or "n.d."
-    key = item.get("key", "")
-    citation_key = item.get("citation_key")
-    item_type = item.get("item_type", "")
+    authors_line = f"\n   Authors: {authors}" if authors else ""
+    citation_line = f"\n   Citation: {item['citation_key']}" if item.get("citation_key") else ""
+    doi_line = f"\n   DOI: {item['doi']}" if item.get("doi") else ""
 
-    lines = [f"{prefix}**{title}**"]
-    if authors:
-        lines.append(f"   Authors: {authors}")
-    lines.append(f"   Date: {date}")
-    lines.append(f"   Type: {item_type}")
-    lines.append(f"   Key: `{key}`")
-    if citation_key:
-        lines.append(f"   Citation: {citation_key}")
-    if item.get("doi"):
-        lines.append(f"   DOI: {item['doi']}")
+    return (
+        f"{prefix}**{title}**{authors_line}\n"
+        f"   Date: {item.get('date') or 'n.d.'}\n"
+        f"   Type: {item.get('item_type', '')}\n"
+        f"   Key: `{item.get('key', '')}`{citation_line}{doi_line}"
+    )
 
-    return "\n".join(lines)
+
+def _format_item_list(header: str, items: List[Dict[str, Any]]) -> str:
+    """Format a header line followed by numbered, blank-line separated summaries."""
+    return header + "".join(
+        f"\n{_format_item_summary(item, i)}\n" for i, item in enumerate(items, 1)
+    )
 
 
 def _format_item_detail(item: Dict[str, Any]) -> str:
@@ -903,6 +1625,28 @@ def _format_item_detail(item: Dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
+# Last collection list rendered by _format_collection_list, and its text
+_collections_md: Tuple[Optional[List[Dict[str, Any]]], str] = (None, "")
+
+
+def _format_collection_list(collections: List[Dict[str, Any]]) -> str:
+    """Format collections as a markdown list.
+
+    ZoteroDb.list_collections returns the same cached list until the
+    database changes, so the last rendering is reused while it is current.
+    """
+    global _collections_md
+    source, text = _collections_md
+    if source is not collections:
+        lines = [f"Found {len(collections)} collection(s):\n"]
+        for c in collections:
+            indent = "  " if c["parent_key"] else ""
+            lines.append(f"{indent}- **{c['name']}** (key: `{c['key']}`)")
+        text = "\n".join(lines)
+        _collections_md = (collections, text)
+    return text
+
+
 # ---------------------------------------------------------------------------
 # MCP Server
 # ---------------------------------------------------------------------------
@@ -912,197 +1656,234 @@ app = Server("zotero")
 # Global database reference (initialized in main)
 db: Optional[ZoteroDb] = None
 
+# ZoteroDb's connection and caches are shared by the worker threads that read
+# tools run in; this keeps them to one thread at a time. A threading lock
+# (rather than asyncio) stays held even if the awaiting tool call is cancelled.
+_db_lock = threading.Lock()
 
-@app.list_tools()
-async def list_tools() -> list[Tool]:
-    # Check if the Zotero plugin is available for write operations
-    plugin_active = await _plugin_available()
-
-    tools = [
-        Tool(
-            name="search_papers",
-            description=(
-                "Search your Zotero library for papers matching a query. "
-                "Searches across titles, authors, abstracts, tags, DOIs, "
-                "and citation keys with fuzzy matching and relevance ranking."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search query (keywords, author names, DOIs, etc.)",
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum results to return (default 20)",
-                        "default": 20,
-                    },
+
+def _locked_db_call(func, *args):
+    """Call func while holding the database lock."""
+    with _db_lock:
+        return func(*args)
+
+
+# In-flight _run_db calls keyed by (bound method, arguments)
+_inflight: Dict[tuple, asyncio.Future] = {}
+
+
+async def _run_db(func, *args):
+    """Run a blocking ZoteroDb call in a worker thread, off the event loop.
+
+    Identical calls made while one is already in flight (e.g. parallel tool
+    calls for the same paper) share its result instead of queueing again.
+    """
+    key = (func, args)
+    future = _inflight.get(key)
+    if future is None:
+        future = asyncio.ensure_future(asyncio.to_thread(_locked_db_call, func, *args))
+        _inflight[key] = future
+        future.add_done_callback(lambda _: _inflight.pop(key, None))
+    # Shielded so one caller being cancelled doesn't cancel it for the rest
+    return await asyncio.shield(future)
+
+
+# Tool definitions are built once at import time; write tools are only
+# advertised while the Zotero MCP Bridge plugin is reachable
+_READ_TOOLS: List[Tool] = [
+    Tool(
+        name="search_papers",
+        description=(
+            "Search your Zotero library for papers matching a query. "
+            "Searches across titles, authors, abstracts, tags, DOIs, "
+            "and citation keys with fuzzy matching and relevance ranking."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query (keywords, author names, DOIs, etc.)",
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum results to return (default 20)",
+                    "default": 20,
                 },
-                "required": ["query"],
             },
+            "required": ["query"],
+        },
+    ),
+    Tool(
+        name="get_paper_details",
+        description=(
+            "Get full metadata for a paper by its Zotero key. "
+            "Returns title, authors, abstract, tags, collections, "
+            "PDF path, citation key, and all bibliographic fields."
         ),
-        Tool(
-            name="get_paper_details",
-            description=(
-                "Get full metadata for a paper by its Zotero key. "
-                "Returns title, authors, abstract, tags, collections, "
-                "PDF path, citation key, and all bibliographic fields."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "key": {
-                        "type": "string",
-                        "description": "Zotero item key (e.g., 'ABC12345')",
-                    },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "key": {
+                    "type": "string",
+                    "description": "Zotero item key (e.g., 'ABC12345')",
                 },
-                "required": ["key"],
             },
+            "required": ["key"],
+        },
+    ),
+    Tool(
+        name="get_bibtex",
+        description=(
+            "Generate a BibTeX entry for a paper. Uses Better BibTeX "
+            "citation keys when available."
         ),
-        Tool(
-            name="get_bibtex",
-            description=(
-                "Generate a BibTeX entry for a paper. Uses Better BibTeX "
-                "citation keys when available."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "key": {
-                        "type": "string",
-                        "description": "Zotero item key",
-                    },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "key": {
+                    "type": "string",
+                    "description": "Zotero item key",
                 },
-                "required": ["key"],
             },
-        ),
-        Tool(
-            name="list_collections",
-            description="List all collections in the Zotero library.",
-            inputSchema={
-                "type": "object",
-                "properties": {},
+            "required": ["key"],
+        },
+    ),
+    Tool(
+        name="list_collections",
+        description="List all collections in the Zotero library.",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+        },
+    ),
+    Tool(
+        name="get_collection_items",
+        description="Get all papers in a specific Zotero collection.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "collection_key": {
+                    "type": "string",
+                    "description": "Collection key",
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum items to return (default 50)",
+                    "default": 50,
+                },
             },
+            "required": ["collection_key"],
+        },
+    ),
+    Tool(
+        name="get_pdf_path",
+        description=(
+            "Get the filesystem path to a paper's PDF attachment. "
+            "Returns the resolved path if the PDF exists on disk."
         ),
-        Tool(
-            name="get_collection_items",
-            description="Get all papers in a specific Zotero collection.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "collection_key": {
-                        "type": "string",
-                        "description": "Collection key",
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum items to return (default 50)",
-                        "default": 50,
-                    },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "key": {
+                    "type": "string",
+                    "description": "Zotero item key",
                 },
-                "required": ["collection_key"],
             },
+            "required": ["key"],
+        },
+    ),
+    Tool(
+        name="library_stats",
+        description="Get summary statistics about the Zotero library.",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+        },
+    ),
+]
+
+_WRITE_TOOLS: List[Tool] = [
+    Tool(
+        name="create_collection",
+        description=(
+            "Create a new collection in Zotero. "
+            "Requires the Zotero MCP Bridge plugin to be running in Zotero."
         ),
-        Tool(
-            name="get_pdf_path",
-            description=(
-                "Get the filesystem path to a paper's PDF attachment. "
-                "Returns the resolved path if the PDF exists on disk."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "key": {
-                        "type": "string",
-                        "description": "Zotero item key",
-                    },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "Name for the new collection",
+                },
+                "parent_key": {
+                    "type": "string",
+                    "description": "Key of parent collection (optional, for nested collections)",
                 },
-                "required": ["key"],
             },
+            "required": ["name"],
+        },
+    ),
+    Tool(
+        name="add_to_collection",
+        description=(
+            "Add papers to a Zotero collection. "
+            "Requires the Zotero MCP Bridge plugin to be running in Zotero."
         ),
-        Tool(
-            name="library_stats",
-            description="Get summary statistics about the Zotero library.",
-            inputSchema={
-                "type": "object",
-                "properties": {},
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "collection_key": {
+                    "type": "string",
+                    "description": "Key of the target collection",
+                },
+                "item_keys": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Array of item keys to add to the collection",
+                },
             },
+            "required": ["collection_key", "item_keys"],
+        },
+    ),
+    Tool(
+        name="remove_from_collection",
+        description=(
+            "Remove papers from a Zotero collection. "
+            "Does not delete the papers, just removes them from the collection. "
+            "Requires the Zotero MCP Bridge plugin to be running in Zotero."
         ),
-    ]
-
-    # Add write tools only when the Zotero plugin is available
-    if plugin_active:
-        tools.extend([
-            Tool(
-                name="create_collection",
-                description=(
-                    "Create a new collection in Zotero. "
-                    "Requires the Zotero MCP Bridge plugin to be running in Zotero."
-                ),
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "name": {
-                            "type": "string",
-                            "description": "Name for the new collection",
-                        },
-                        "parent_key": {
-                            "type": "string",
-                            "description": "Key of parent collection (optional, for nested collections)",
-                        },
-                    },
-                    "required": ["name"],
-                },
-            ),
-            Tool(
-                name="add_to_collection",
-                description=(
-                    "Add papers to a Zotero collection. "
-                    "Requires the Zotero MCP Bridge plugin to be running in Zotero."
-                ),
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "collection_key": {
-                            "type": "string",
-                            "description": "Key of the target collection",
-                        },
-                        "item_keys": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Array of item keys to add to the collection",
-                        },
-                    },
-                    "required": ["collection_key", "item_keys"],
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "collection_key": {
+                    "type": "string",
+                    "description": "Key of the collection",
                 },
-            ),
-            Tool(
-                name="remove_from_collection",
-                description=(
-                    "Remove papers from a Zotero collection. "
-                    "Does not delete the papers, just removes them from the collection. "
-                    "Requires the Zotero MCP Bridge plugin to be running in Zotero."
-                ),
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "collection_key": {
-                            "type": "string",
-                            "description": "Key of the collection",
-                        },
-                        "item_keys": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Array of item keys to remove from the collection",
-                        },
-                    },
-                    "required": ["collection_key", "item_keys"],
+                "item_keys": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Array of item keys to remove from the collection",
                 },
-            ),
-        ])
+            },
+            "required": ["collection_key", "item_keys"],
+        },
+    ),
+]
+
+
+@app.list_tools()
+async def list_tools() -> list[Tool]:
+    # Check if the Zotero plugin is available for write operations
+    if await _plugin_available():
+        return _READ_TOOLS + _WRITE_TOOLS
+    return list(_READ_TOOLS)
+
 
-    return tools
+def _text(text: str) -> list[TextContent]:
+    """Wrap a tool response string as MCP content."""
+    return [TextContent(type="text", text=text)]
 
 
 @app.call_tool()
@@ -1113,72 +1894,65 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
         if name == "search_papers":
             query = arguments["query"]
             limit = arguments.get("limit", DEFAULT_SEARCH_LIMIT)
-            items = db.search_items(query, limit)
+            # One extra row tells us whether the result list was truncated
+            items = await _run_db(db.search_items, query, limit + 1)
 
             if not items:
-                return [TextContent(type="text", text=f"No results for '{query}'.")]
+                return _text(f"No results for '{query}'.")
 
-            lines = [f"Found {len(items)} result(s) for '{query}':\n"]
-            for i, item in enumerate(items, 1):
-                lines.append(_format_item_summary(item, i))
-                lines.append("")
-            return [TextContent(type="text", text="\n".join(lines))]
+            more = len(items) > limit
+            items = items[:limit]
+            text = await asyncio.to_thread(
+                _format_item_list, f"Found {len(items)} result(s) for '{query}':\n", items
+            )
+            if more:
+                text += "\nMore matches are available; refine the query or raise the limit.\n"
+            return _text(text)
 
         elif name == "get_paper_details":
             key = arguments["key"]
-            item = db.get_item(key)
+            item = await _run_db(db.get_item, key)
             if not item:
-                return [TextContent(type="text", text=f"No item found with key '{key}'.")]
-            return [TextContent(type="text", text=_format_item_detail(item))]
+                return _text(f"No item found with key '{key}'.")
+            return _text(_format_item_detail(item))
 
         elif name == "get_bibtex":
             key = arguments["key"]
-            bibtex = db.get_bibtex(key)
+            bibtex = await _run_db(db.get_bibtex, key)
             if not bibtex:
-                return [TextContent(type="text", text=f"No item found with key '{key}'.")]
-            return [TextContent(type="text", text=f"```bibtex\n{bibtex}```")]
+                return _text(f"No item found with key '{key}'.")
+            return _text(f"```bibtex\n{bibtex}```")
 
         elif name == "list_collections":
-            collections = db.list_collections()
+            collections = await _run_db(db.list_collections)
             if not collections:
-                return [TextContent(type="text", text="No collections found.")]
+                return _text("No collections found.")
 
-            lines = [f"Found {len(collections)} collection(s):\n"]
-            for c in collections:
-                indent = "  " if c["parent_key"] else ""
-                lines.append(f"{indent}- **{c['name']}** (key: `{c['key']}`)")
-            return [TextContent(type="text", text="\n".join(lines))]
+            return _text(_format_collection_list(collections))
 
         elif name == "get_collection_items":
             collection_key = arguments["collection_key"]
             limit = arguments.get("limit", 50)
-            items = db.get_collection_items(collection_key, limit)
+            items = await _run_db(db.get_collection_items, collection_key, limit)
 
             if not items:
-                return [TextContent(
-                    type="text",
-                    text=f"No items found in collection '{collection_key}'.",
-                )]
+                return _text(f"No items found in collection '{collection_key}'.")
 
-            lines = [f"Collection contains {len(items)} item(s):\n"]
-            for i, item in enumerate(items, 1):
-                lines.append(_format_item_summary(item, i))
-                lines.append("")
-            return [TextContent(type="text", text="\n".join(lines))]
+            text = await asyncio.to_thread(
+                _format_item_list, f"Collection contains {len(items)} item(s):\n", items
+            )
+            return _text(text)
 
         elif name == "get_pdf_path":
             key = arguments["key"]
-            path = db.get_pdf_path(key)
+            path = await _run_db(db.get_pdf_path, key)
             if path:
-                return [TextContent(type="text", text=f"PDF path: {path}")]
-            return [TextContent(
-                type="text",
-                text=f"No PDF attachment found for item '{key}'.",
-            )]
+                return _text(f"PDF path: {path}")
+            return _text(f"No PDF attachment found for item '{key}'.")
 
         elif name == "library_stats":
-            count = db.item_count()
-            collections = db.list_collections()
+            count = await _run_db(db.item_count)
+            collections = await _run_db(db.list_collections)
             plugin_active = await _plugin_available()
             text = (
                 f"**Zotero Library Statistics**\n\n"
@@ -1189,8 +1963,7 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
             )
 
             # Check for Better BibTeX
-            bbt_path = db.data_dir / "better-bibtex.sqlite"
-            if bbt_path.exists():
+            if db.bbt_present:
                 text += "- Better BibTeX: installed\n"
             else:
                 text += "- Better BibTeX: not detected\n"
@@ -1201,7 +1974,7 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
             else:
                 text += "- Zotero MCP Bridge plugin: not detected (read-only mode)\n"
 
-            return [TextContent(type="text", text=text)]
+            return _text(text)
 
         elif name == "create_collection":
             result = await _plugin_rpc("createCollection", {
@@ -1214,13 +1987,12 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
             )
             if result.get("parentKey"):
                 text += f"- Parent: `{result['parentKey']}`\n"
-            return [TextContent(type="text", text=text)]
+            return _text(text)
 
         elif name == "add_to_collection":
-            result = await _plugin_rpc("addToCollection", {
-                "collectionKey": arguments["collection_key"],
-                "itemKeys": arguments["item_keys"],
-            })
+            result = await _batched_rpc(
+                "addToCollection", arguments["collection_key"], arguments["item_keys"], "added"
+            )
             added = result.get("added", [])
             errors = result.get("errors", [])
             text = f"Added {len(added)} item(s) to collection `{arguments['collection_key']}`.\n"
@@ -1228,13 +2000,13 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
                 text += "\nErrors:\n"
                 for err in errors:
                     text += f"- `{err['key']}`: {err['error']}\n"
-            return [TextContent(type="text", text=text)]
+            return _text(text)
 
         elif name == "remove_from_collection":
-            result = await _plugin_rpc("removeFromCollection", {
-                "collectionKey": arguments["collection_key"],
-                "itemKeys": arguments["item_keys"],
-            })
+            result = await _batched_rpc(
+                "removeFromCollection", arguments["collection_key"], arguments["item_keys"],
+                "removed",
+            )
             removed = result.get("removed", [])
             errors = result.get("errors", [])
             text = f"Removed {len(removed)} item(s) from collection `{arguments['collection_key']}`.\n"
@@ -1242,13 +2014,13 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
                 text += "\nErrors:\n"
                 for err in errors:
                     text += f"- `{err['key']}`: {err['error']}\n"
-            return [TextContent(type="text", text=text)]
+            return _text(text)
 
         else:
-            return [TextContent(type="text", text=f"Unknown tool: {name}")]
+            return _text(f"Unknown tool: {name}")
 
     except Exception as e:
-        return [TextContent(type="text", text=f"Error: {e}")]
+        return _text(f"Error: {e}")
 
 
 # ---------------------------------------------------------------------------
@@ -1278,12 +2050,16 @@ async def main():
 
     from mcp.server.stdio import stdio_server
 
-    async with stdio_server() as (read_stream, write_stream):
-        await app.run(
-            read_stream,
-            write_stream,
-            app.create_initialization_options(),
-        )
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await app.run(
+                read_stream,
+                write_stream,
+                app.create_initialization_options(),
+            )
+    finally:
+        await _close_client()
+        db.close()
 
 
 if __name__ == "__main__":